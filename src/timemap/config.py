@@ -59,12 +59,24 @@ def ensure_config():
             f.write(DEFAULT_CONFIG.strip())
 
 
+# (mtime_ns, parsed config); re-parsed only when the file changes
+_config_cache = (None, {})
+
+
 def load_config():
+    global _config_cache
     ensure_config()
     try:
-        return toml.load(CONFIG_PATH)
-    except Exception:
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
         return {}
+    if _config_cache[0] != mtime:
+        try:
+            parsed = toml.load(CONFIG_PATH)
+        except Exception:
+            parsed = {}
+        _config_cache = (mtime, parsed)
+    return _config_cache[1]
 
 
 def get_editor():
@@ -1,8 +1,13 @@
 import sqlite3
 import os
 import calendar
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
 from datetime import date, timedelta, datetime
-from typing import List, Tuple, Set
+from typing import Dict, List, Tuple, Set
 import platform
 
 if platform.system() == "Windows":
@@ -12,9 +17,31 @@ else:
     DB_PATH = os.path.expanduser("~/.local/share/timemap.db")
 
 
-def get_db():
+# Per-connection tuning for a read-heavy workload with small, rare writes.
+_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA busy_timeout=5000;
+"""
+
+# Prepared statements kept per connection (sqlite3 defaults to 128).
+_STATEMENT_CACHE_SIZE = 256
+
+# journal_mode is persisted in the database file, so it is set only once.
+_pragmas_applied = False
+
+
+def get_db(check_same_thread: bool = True):
+    global _pragmas_applied
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=check_same_thread,
+                           cached_statements=_STATEMENT_CACHE_SIZE)
+    if not _pragmas_applied:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _pragmas_applied = True
+    conn.executescript(_PRAGMAS)
     c = conn.cursor()
 
     c.execute('''CREATE TABLE IF NOT EXISTS items
@@ -43,10 +70,154 @@ def get_db():
                   FOREIGN KEY(tag_id) REFERENCES tags(id),
                   PRIMARY KEY(item_id, tag_id))''')
 
+    # Serve the per-date lookups and the ordered todo scan from indexes
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_items_date_type ON items(date, type, is_done)")
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_items_type_done ON items(type, is_done)")
+
     conn.commit()
     return conn
 
 
+def _open_read_only(check_same_thread: bool = False):
+    """Opens a read-only connection; the database must already exist."""
+    uri = Path(DB_PATH).as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread,
+                           cached_statements=_STATEMENT_CACHE_SIZE)
+    conn.executescript(_PRAGMAS)
+    return conn
+
+
+# Single connection used for every write, guarded by _write_lock.
+_write_conn = None
+_write_lock = threading.RLock()
+# Depth of nested `batched()` blocks on the thread holding _write_lock.
+_batch_depth = 0
+# Bumped after every write, so cached query results can tell they are stale.
+DATA_VERSION = 0
+
+
+def _get_write_conn():
+    global _write_conn
+    if _write_conn is None:
+        _write_conn = get_db(check_same_thread=False)
+        _write_conn.isolation_level = "IMMEDIATE"
+    return _write_conn
+
+
+@contextmanager
+def batched():
+    """
+    Groups several writes into one transaction, so a single commit
+    (and a single fsync) covers all of them:
+
+        with db.batched():
+            db.add_item("note", "a")
+            db.add_item("note", "b")
+
+    Nested blocks join the outermost transaction. DATA_VERSION is bumped
+    once, after the outermost block commits or rolls back.
+    """
+    global _batch_depth, DATA_VERSION
+    with _write_lock:
+        conn = _get_write_conn()
+        _batch_depth += 1
+        try:
+            yield conn
+            if _batch_depth == 1:
+                conn.commit()
+        except Exception:
+            if _batch_depth == 1:
+                conn.rollback()
+            raise
+        finally:
+            _batch_depth -= 1
+            if _batch_depth == 0:
+                DATA_VERSION += 1
+
+
+@contextmanager
+def _writer():
+    """Yields the write connection, committing unless a batch is open."""
+    global DATA_VERSION
+    with _write_lock:
+        conn = _get_write_conn()
+        if _batch_depth:
+            # batched() commits and bumps DATA_VERSION when it exits
+            yield conn
+            return
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            DATA_VERSION += 1
+
+
+# Pool of read-only connections. WAL lets them read while a write is in
+# progress, so background workers never queue behind each other.
+_READ_POOL_SIZE = os.cpu_count() or 4
+_read_pool = queue.Queue()
+_read_pool_lock = threading.Lock()
+_read_pool_opened = 0
+
+
+@contextmanager
+def read_conn(conn=None):
+    """
+    Yields `conn` when given, otherwise a connection borrowed from the
+    read-only pool for the duration of the block.
+    """
+    global _read_pool_opened
+    if conn is not None:
+        yield conn
+        return
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        with _read_pool_lock:
+            grow = _read_pool_opened < _READ_POOL_SIZE
+            if grow:
+                _read_pool_opened += 1
+        if grow:
+            _get_write_conn()  # creates the file and schema on first use
+            conn = _open_read_only()
+        else:
+            conn = _read_pool.get()
+    try:
+        yield conn
+    finally:
+        _read_pool.put(conn)
+
+
+# Long-lived connection for the TUI's hot read paths.
+_read_conn = None
+
+
+def get_read_conn():
+    """
+    Returns a read-only connection that stays open for the whole process,
+    so the calendar and details panel reuse one warm page cache instead of
+    reopening the database (and its -wal/-shm files) on every keypress.
+    """
+    global _read_conn
+    if _read_conn is None:
+        _get_write_conn()
+        _read_conn = _open_read_only()
+    return _read_conn
+
+
+def data_version(conn) -> int:
+    """
+    SQLite's PRAGMA data_version for `conn`: it changes whenever another
+    connection, in this process or another one (e.g. the CLI), commits.
+    """
+    return conn.execute("PRAGMA data_version").fetchone()[0]
+
+
 def _cleanup_orphaned_tags(conn):
     """Helper to delete tags that have 0 references in the item_tags table."""
     conn.execute(
@@ -56,47 +227,71 @@ def _cleanup_orphaned_tags(conn):
 def add_item(item_type: str, content: str, target_date: str = None, alias: str = None, mood: str = None):
     if target_date is None:
         target_date = date.today().isoformat()
-    conn = get_db()
-    conn.execute("INSERT INTO items (date, type, content, is_done, finish_date, alias, mood) VALUES (?, ?, ?, 0, NULL, ?, ?)",
-                 (target_date, item_type, content, alias, mood))
-    conn.commit()
-    conn.close()
-
-
-def get_items_for_date(target_date: str) -> List[Tuple]:
-    conn = get_db()
-    c = conn.cursor()
-
-    c.execute("SELECT id, type, content, is_done, finish_date, alias, mood FROM items WHERE date = ? AND type != 'todo' AND deleted_at IS NULL", (target_date,))
-    items = c.fetchall()
-
-    c.execute("""
-        SELECT id, type, content, is_done, finish_date, alias, mood FROM items
-        WHERE type = 'todo'
-          AND date <= ?
-          AND (is_done = 0 OR finish_date >= ?)
-          AND deleted_at IS NULL
-    """, (target_date, target_date))
-
-    items.extend(c.fetchall())
-    conn.close()
-    return items
+    with _writer() as conn:
+        conn.execute("INSERT INTO items (date, type, content, is_done, finish_date, alias, mood) VALUES (?, ?, ?, 0, NULL, ?, ?)",
+                     (target_date, item_type, content, alias, mood))
+
+
+# Hot-path queries, kept as constants so every call hits sqlite3's
+# per-connection statement cache with the exact same SQL text.
+_SQL_DATED_ITEMS = """
+    SELECT id, type, content, is_done, finish_date, alias, mood FROM items
+    WHERE date = ? AND type != 'todo' AND deleted_at IS NULL
+    ORDER BY id
+"""
+_SQL_OPEN_TODOS = """
+    SELECT id, type, content, is_done, finish_date, alias, mood FROM items
+    WHERE type = 'todo'
+      AND date <= ?
+      AND (is_done = 0 OR finish_date >= ?)
+      AND deleted_at IS NULL
+    ORDER BY is_done, id
+"""
+_SQL_MONTH_COUNTS = """
+    SELECT date, type, count(*)
+    FROM items
+    WHERE type IN ('diary', 'file', 'note')
+        AND date LIKE ?
+        AND deleted_at IS NULL
+    GROUP BY date, type
+"""
+_SQL_MONTH_MOODS = """
+    SELECT date, mood FROM items
+    WHERE type = 'diary' AND date LIKE ? AND deleted_at IS NULL
+"""
+_SQL_MONTH_TODOS = """
+    SELECT date, finish_date, is_done FROM items
+    WHERE type = 'todo' AND date <= ? AND deleted_at IS NULL
+"""
+
+
+def get_items_for_date(target_date: str, conn=None) -> List[sqlite3.Row]:
+    # Columns follow DetailItem's parameters, so rows can be star-unpacked
+    with read_conn(conn) as conn:
+        c = conn.cursor()
+        c.row_factory = sqlite3.Row
+
+        c.execute(_SQL_DATED_ITEMS, (target_date,))
+        items = c.fetchall()
+
+        c.execute(_SQL_OPEN_TODOS, (target_date, target_date))
+
+        items.extend(c.fetchall())
+        return items
 
 
 def toggle_todo_status(item_id: int, action_date: str):
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT is_done FROM items WHERE id = ?", (item_id,))
-    row = c.fetchone()
-    if row:
-        if row[0] == 0:
-            c.execute(
-                "UPDATE items SET is_done = 1, finish_date = ? WHERE id = ?", (action_date, item_id))
-        else:
-            c.execute(
-                "UPDATE items SET is_done = 0, finish_date = NULL WHERE id = ?", (item_id,))
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        c = conn.cursor()
+        c.execute("SELECT is_done FROM items WHERE id = ?", (item_id,))
+        row = c.fetchone()
+        if row:
+            if row[0] == 0:
+                c.execute(
+                    "UPDATE items SET is_done = 1, finish_date = ? WHERE id = ?", (action_date, item_id))
+            else:
+                c.execute(
+                    "UPDATE items SET is_done = 0, finish_date = NULL WHERE id = ?", (item_id,))
 
 
 def soft_delete_item(item_id: int):
@@ -104,125 +299,108 @@ def soft_delete_item(item_id: int):
     Keeps only the 3 most recent delted items.
     Permanently deletes anything older. 
     """
-    conn = get_db()
-    c = conn.cursor()
     now = datetime.now().isoformat()
-
-    c.execute("UPDATE items SET deleted_at = ? WHERE id = ?", (now, item_id))
-    c.execute(
-        "SELECT id FROM items WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC")
-    deleted_rows = c.fetchall()
-    if len(deleted_rows) > 3:
-        to_remove = deleted_rows[3:]
-        for row in to_remove:
-            c.execute("DELETE FROM item_tags WHERE item_id = ?", (row[0],))
-            c.execute("DELETE FROM items WHERE id = ?", (row[0],))
-        _cleanup_orphaned_tags(conn)
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        c = conn.cursor()
+        c.execute("UPDATE items SET deleted_at = ? WHERE id = ?", (now, item_id))
+        c.execute(
+            "SELECT id FROM items WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC")
+        deleted_rows = c.fetchall()
+        if len(deleted_rows) > 3:
+            to_remove = deleted_rows[3:]
+            for row in to_remove:
+                c.execute("DELETE FROM item_tags WHERE item_id = ?", (row[0],))
+                c.execute("DELETE FROM items WHERE id = ?", (row[0],))
+            _cleanup_orphaned_tags(conn)
 
 
 def recover_last_deleted():
-    conn = get_db()
-    c = conn.cursor()
-    c.execute(
-        "SELECT id FROM items WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC LIMIT 1")
-    row = c.fetchone()
-    if row:
-        c.execute("UPDATE items SET deleted_at = NULL WHERE id = ?", (row[0],))
-        conn.commit()
-        conn.close()
-        return True
-    conn.close()
+    with _writer() as conn:
+        c = conn.cursor()
+        c.execute(
+            "SELECT id FROM items WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC LIMIT 1")
+        row = c.fetchone()
+        if row:
+            c.execute("UPDATE items SET deleted_at = NULL WHERE id = ?", (row[0],))
+            return True
     return False
 
 
 def empty_trash():
-    conn = get_db()
-    conn.execute(
-        "DELETE FROM item_tags WHERE item_id IN (SELECT id FROM items WHERE deleted_at IS NOT NULL)")
-    conn.execute("DELETE FROM items WHERE deleted_at IS NOT NULL")
-    _cleanup_orphaned_tags(conn)
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        conn.execute(
+            "DELETE FROM item_tags WHERE item_id IN (SELECT id FROM items WHERE deleted_at IS NOT NULL)")
+        conn.execute("DELETE FROM items WHERE deleted_at IS NOT NULL")
+        _cleanup_orphaned_tags(conn)
 
 
 def delete_item(item_id: int):
-    conn = get_db()
-    conn.execute("DELETE FROM item_tags WHERE item_id = ?", (item_id,))
-    conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
-    _cleanup_orphaned_tags(conn)
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        conn.execute("DELETE FROM item_tags WHERE item_id = ?", (item_id,))
+        conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        _cleanup_orphaned_tags(conn)
 
 
 def update_item_content(item_id: int, new_content: str):
-    conn = get_db()
-    conn.execute("UPDATE items SET content = ? WHERE id = ?",
-                 (new_content, item_id))
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        conn.execute("UPDATE items SET content = ? WHERE id = ?",
+                     (new_content, item_id))
 
 
 def update_item_alias(item_id: int, new_alias: str):
-    conn = get_db()
-    conn.execute("UPDATE items SET alias = ? WHERE id = ?",
-                 (new_alias, item_id))
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        conn.execute("UPDATE items SET alias = ? WHERE id = ?",
+                     (new_alias, item_id))
 
 
 def update_diary_item(item_id: int, title: str, mood: str, content: str):
-    conn = get_db()
-    conn.execute("UPDATE items SET alias = ?, mood = ?, content = ? WHERE id = ?",
-                 (title, mood, content, item_id))
-    conn.commit()
-    conn.close()
+    with _writer() as conn:
+        conn.execute("UPDATE items SET alias = ?, mood = ?, content = ? WHERE id = ?",
+                     (title, mood, content, item_id))
 
 
 def get_marked_days(year: int, month: int) -> Set[int]:
-    conn = get_db()
-    c = conn.cursor()
-    marked_days = set()
+    with read_conn() as conn:
+        c = conn.cursor()
+        marked_days = set()
 
-    search_pattern = f"{year}-{month:02d}-%"
-    c.execute(
-        "SELECT date FROM items WHERE type != 'todo' AND date LIKE ?", (search_pattern,))
-    for row in c.fetchall():
-        try:
-            marked_days.add(date.fromisoformat(row[0]).day)
-        except ValueError:
-            pass
-
-    _, last_day = calendar.monthrange(year, month)
-    month_start = date(year, month, 1)
-    month_end = date(year, month, last_day)
-
-    c.execute("SELECT date, finish_date, is_done FROM items WHERE type = 'todo'")
-    todos = c.fetchall()
-
-    for create_str, finish_str, is_done in todos:
-        try:
-            create_date = date.fromisoformat(create_str)
-            if create_date > month_end:
-                continue
-            finish_date = date.fromisoformat(finish_str) if (
-                is_done and finish_str) else None
-            if finish_date and finish_date < month_start:
+        search_pattern = f"{year}-{month:02d}-%"
+        c.execute(
+            "SELECT date FROM items WHERE type != 'todo' AND date LIKE ?", (search_pattern,))
+        for row in c.fetchall():
+            try:
+                marked_days.add(date.fromisoformat(row[0]).day)
+            except ValueError:
+                pass
+
+        _, last_day = calendar.monthrange(year, month)
+        month_start = date(year, month, 1)
+        month_end = date(year, month, last_day)
+
+        c.execute("SELECT date, finish_date, is_done FROM items WHERE type = 'todo'")
+        todos = c.fetchall()
+
+        for create_str, finish_str, is_done in todos:
+            try:
+                create_date = date.fromisoformat(create_str)
+                if create_date > month_end:
+                    continue
+                finish_date = date.fromisoformat(finish_str) if (
+                    is_done and finish_str) else None
+                if finish_date and finish_date < month_start:
+                    continue
+
+                start = max(create_date, month_start)
+                end = min(finish_date, month_end) if finish_date else month_end
+
+                if start <= end:
+                    curr = start
+                    while curr <= end:
+                        marked_days.add(curr.day)
+                        curr += timedelta(days=1)
+            except ValueError:
                 continue
-
-            start = max(create_date, month_start)
-            end = min(finish_date, month_end) if finish_date else month_end
-
-            if start <= end:
-                curr = start
-                while curr <= end:
-                    marked_days.add(curr.day)
-                    curr += timedelta(days=1)
-        except ValueError:
-            continue
-    conn.close()
-    return marked_days
+        return marked_days
 
 
 def get_all_entries():
@@ -230,78 +408,77 @@ def get_all_entries():
     Fetches all items for export.
     Returns list of tuples: (type, date, alias, content, mood)
     """
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("SELECT type, date, alias, content, mood FROM items ORDER BY date")
-    rows = c.fetchall()
-    conn.close()
-    return rows
+    with read_conn() as conn:
+        c = conn.cursor()
+        c.execute("SELECT type, date, alias, content, mood FROM items ORDER BY date")
+        rows = c.fetchall()
+        return rows
 
 
-def get_month_stats(year: int, month: int) -> dict:
+def get_month_stats(year: int, month: int, conn=None) -> dict:
     """
-    Returns a dict where key is day (int) and value is a dict of counts.
+    Returns a dict where key is day (int) and value is a dict of counts,
+    with their sum under '_total'.
     """
-    conn = get_db()
-    c = conn.cursor()
-    stats = {}
-
-    _, last_day = calendar.monthrange(year, month)
-    for d in range(1, last_day + 1):
-        stats[d] = {'diary': 0, 'file': 0, 'todo': 0, 'note': 0}
-
-    search_pattern = f"{year}-{month:02d}-%"
-    c.execute("""
-        SELECT date, type, count(*)
-        FROM items
-        WHERE type IN ('diary', 'file', 'note')
-            AND date LIKE ?
-            AND deleted_at IS NULL
-        GROUP BY date, type
-    """, (search_pattern,))
-
-    for date_str, type_, count in c.fetchall():
-        try:
-            d_obj = date.fromisoformat(date_str)
-            if d_obj.day in stats:
-                stats[d_obj.day][type_] = count
-        except ValueError:
-            pass
+    with read_conn(conn) as conn:
+        c = conn.cursor()
+        stats = {}
+
+        _, last_day = calendar.monthrange(year, month)
+        for d in range(1, last_day + 1):
+            stats[d] = {'diary': 0, 'file': 0, 'todo': 0, 'note': 0}
+
+        search_pattern = f"{year}-{month:02d}-%"
+        c.execute(_SQL_MONTH_COUNTS, (search_pattern,))
+
+        for date_str, type_, count in c.fetchall():
+            try:
+                d_obj = date.fromisoformat(date_str)
+                if d_obj.day in stats:
+                    stats[d_obj.day][type_] = count
+            except ValueError:
+                pass
+
+        c.execute(_SQL_MONTH_MOODS, (search_pattern,))
+        for date_str, mood in c.fetchall():
+            try:
+                d_obj = date.fromisoformat(date_str)
+                if d_obj.day in stats and mood:
+                    stats[d_obj.day]['diary_mood'] = mood
+            except ValueError:
+                pass
+        month_start = date(year, month, 1)
+        month_end = date(year, month, last_day)
+
+        c.execute(_SQL_MONTH_TODOS, (month_end.isoformat(),))
+
+        for create_str, finish_str, is_done in c.fetchall():
+            try:
+                create_date = date.fromisoformat(create_str)
+                finish_date = date.fromisoformat(finish_str) if (
+                    is_done and finish_str) else None
+
+                start = max(create_date, month_start)
+                end = min(finish_date, month_end) if finish_date else month_end
+
+                if start <= end:
+                    curr = start
+                    while curr <= end:
+                        stats[curr.day]['todo'] += 1
+                        curr += timedelta(days=1)
+            except ValueError:
+                continue
 
-    c.execute(
-        "SELECT date, mood FROM items WHERE type='diary' AND date LIKE ? AND deleted_at IS NULL", (search_pattern,))
-    for date_str, mood in c.fetchall():
-        try:
-            d_obj = date.fromisoformat(date_str)
-            if d_obj.day in stats and mood:
-                stats[d_obj.day]['diary_mood'] = mood
-        except ValueError:
-            pass
-    month_start = date(year, month, 1)
-    month_end = date(year, month, last_day)
-
-    c.execute("SELECT date, finish_date, is_done FROM items WHERE type = 'todo' AND date <= ? AND deleted_at IS NULL",
-              (month_end.isoformat(),))
-
-    for create_str, finish_str, is_done in c.fetchall():
-        try:
-            create_date = date.fromisoformat(create_str)
-            finish_date = date.fromisoformat(finish_str) if (
-                is_done and finish_str) else None
-
-            start = max(create_date, month_start)
-            end = min(finish_date, month_end) if finish_date else month_end
-
-            if start <= end:
-                curr = start
-                while curr <= end:
-                    stats[curr.day]['todo'] += 1
-                    curr += timedelta(days=1)
-        except ValueError:
-            continue
-
-    conn.close()
-    return stats
+        for day_stats in stats.values():
+            day_stats['_total'] = (day_stats['diary'] + day_stats['file'] +
+                                   day_stats['todo'] + day_stats['note'])
+        return stats
+
+
+# year -> (DATA_VERSION, fetched_at, stats). The TTL catches writes made
+# by other processes (e.g. the CLI), which DATA_VERSION cannot see.
+_YEAR_STATS_TTL = 30.0
+_year_stats_cache = {}
 
 
 def get_year_stats(year: int) -> dict:
@@ -316,64 +493,66 @@ def get_year_stats(year: int) -> dict:
         'total_todos': int,
         'finished_todos': int
     }
+    Results are cached until the next write or for _YEAR_STATS_TTL seconds.
     """
-    conn = get_db()
-    c = conn.cursor()
-
-    stats = {
-        'diary': [0] * 12,
-        'note': [0] * 12,
-        'file': [0] * 12,
-        'todo_created': [0] * 12,
-        'todo_done': [0] * 12,
-        'total_todos': 0,
-        'finished_todos': 0
-    }
+    version, now = DATA_VERSION, time.monotonic()
+    cached = _year_stats_cache.get(year)
+    if cached and cached[0] == version and now - cached[1] < _YEAR_STATS_TTL:
+        return cached[2]
+    stats = _query_year_stats(year)
+    _year_stats_cache[year] = (version, now, stats)
+    return stats
 
-    search_pattern = f"{year}-%"
 
-    c.execute("""
-        SELECT type, date, is_done 
-        FROM items 
-        WHERE date LIKE ? AND deleted_at IS NULL
-    """, (search_pattern,))
-
-    for type_, date_str, is_done in c.fetchall():
-        try:
-            d = date.fromisoformat(date_str)
-            month_idx = d.month - 1  # 0-11
-
-            if type_ == 'diary':
-                stats['diary'][month_idx] += 1
-            elif type_ == 'note':
-                stats['note'][month_idx] += 1
-            elif type_ == 'file':
-                stats['file'][month_idx] += 1
-            elif type_ == 'todo':
-                stats['todo_created'][month_idx] += 1
-                stats['total_todos'] += 1
-        except ValueError:
-            pass
-
-    c.execute("""
-        SELECT finish_date FROM items 
-        WHERE type = 'todo' 
-          AND is_done = 1 
-          AND finish_date LIKE ? 
-          AND deleted_at IS NULL
-    """, (search_pattern,))
-
-    for (finish_date_str,) in c.fetchall():
-        try:
-            d = date.fromisoformat(finish_date_str)
-            month_idx = d.month - 1
-            stats['todo_done'][month_idx] += 1
-            stats['finished_todos'] += 1
-        except ValueError:
-            pass
-
-    conn.close()
-    return stats
+def _query_year_stats(year: int) -> dict:
+    with read_conn() as conn:
+        c = conn.cursor()
+
+        stats = {
+            'diary': [0] * 12,
+            'note': [0] * 12,
+            'file': [0] * 12,
+            'todo_created': [0] * 12,
+            'todo_done': [0] * 12,
+            'total_todos': 0,
+            'finished_todos': 0
+        }
+
+        search_pattern = f"{year}-%"
+        month_keys = {'diary': 'diary', 'note': 'note',
+                      'file': 'file', 'todo': 'todo_created'}
+
+        # SQLite does the per-month counting; dates are stored as YYYY-MM-DD
+        c.execute("""
+            SELECT type, CAST(substr(date, 6, 2) AS INTEGER) AS m, COUNT(*)
+            FROM items
+            WHERE date LIKE ? AND deleted_at IS NULL
+            GROUP BY type, m
+        """, (search_pattern,))
+
+        for type_, month, count in c.fetchall():
+            key = month_keys.get(type_)
+            if key and 1 <= month <= 12:
+                stats[key][month - 1] += count
+                if type_ == 'todo':
+                    stats['total_todos'] += count
+
+        c.execute("""
+            SELECT CAST(substr(finish_date, 6, 2) AS INTEGER) AS m, COUNT(*)
+            FROM items
+            WHERE type = 'todo'
+              AND is_done = 1
+              AND finish_date LIKE ?
+              AND deleted_at IS NULL
+            GROUP BY m
+        """, (search_pattern,))
+
+        for month, count in c.fetchall():
+            if 1 <= month <= 12:
+                stats['todo_done'][month - 1] += count
+                stats['finished_todos'] += count
+
+        return stats
 
 
 def update_item_tags(item_id: int, tags_list: List[str]):
@@ -382,83 +561,115 @@ def update_item_tags(item_id: int, tags_list: List[str]):
     1. Removes ALL existing tags for this item.
     2. Adds the new tags provided (if any).
     """
-    conn = get_db()
-    c = conn.cursor()
-
-    c.execute("DELETE FROM item_tags WHERE item_id = ?", (item_id,))
-
     colors = ["red", "green", "blue", "magenta", "yellow", "cyan",
               "#ff5555", "#50fa7b", "#f1fa8c", "#bd93f9", "#ff79c6", "#8be9fd"]
 
-    for tag_name in tags_list:
-        clean_tag = tag_name.strip()
-        if not clean_tag:
-            continue
+    with _writer() as conn:
+        c = conn.cursor()
 
-        c.execute("SELECT id FROM tags WHERE name = ?", (clean_tag,))
-        row = c.fetchone()
+        c.execute("DELETE FROM item_tags WHERE item_id = ?", (item_id,))
 
-        if row:
-            tag_id = row[0]
-        else:
-            import random
-            color = random.choice(colors)
-            c.execute("INSERT INTO tags (name, color) VALUES (?, ?)",
-                      (clean_tag, color))
-            tag_id = c.lastrowid
+        for tag_name in tags_list:
+            clean_tag = tag_name.strip()
+            if not clean_tag:
+                continue
 
-        c.execute(
-            "INSERT INTO item_tags (item_id, tag_id) VALUES (?, ?)", (item_id, tag_id))
-    _cleanup_orphaned_tags(conn)
+            c.execute("SELECT id FROM tags WHERE name = ?", (clean_tag,))
+            row = c.fetchone()
 
-    conn.commit()
-    conn.close()
+            if row:
+                tag_id = row[0]
+            else:
+                import random
+                color = random.choice(colors)
+                c.execute("INSERT INTO tags (name, color) VALUES (?, ?)",
+                          (clean_tag, color))
+                tag_id = c.lastrowid
+
+            c.execute(
+                "INSERT INTO item_tags (item_id, tag_id) VALUES (?, ?)", (item_id, tag_id))
+        _cleanup_orphaned_tags(conn)
 
 
 def get_tags_for_item(item_id: int) -> List[Tuple]:
     """Returns list of (name, color) for an item."""
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("""
-        SELECT t.name, t.color 
-        FROM tags t 
-        JOIN item_tags it ON t.id = it.tag_id 
-        WHERE it.item_id = ?
-    """, (item_id,))
-    tags = c.fetchall()
-    conn.close()
-    return tags
+    with read_conn() as conn:
+        c = conn.cursor()
+        c.execute("""
+            SELECT t.name, t.color 
+            FROM tags t 
+            JOIN item_tags it ON t.id = it.tag_id 
+            WHERE it.item_id = ?
+        """, (item_id,))
+        tags = c.fetchall()
+        return tags
+
+
+def get_tags_for_items(item_ids: List[int], conn=None) -> Dict[int, List[Tuple]]:
+    """Returns {item_id: [(name, color), ...]} for several items in one query."""
+    grouped = {}
+    if not item_ids:
+        return grouped
+    placeholders = ",".join("?" * len(item_ids))
+    with read_conn(conn) as conn:
+        c = conn.cursor()
+        c.execute(f"""
+            SELECT it.item_id, t.name, t.color
+            FROM tags t
+            JOIN item_tags it ON t.id = it.tag_id
+            WHERE it.item_id IN ({placeholders})
+            ORDER BY it.item_id, it.tag_id
+        """, list(item_ids))
+        for item_id, name, color in c.fetchall():
+            grouped.setdefault(item_id, []).append((name, color))
+    return grouped
 
 
 def get_all_tags() -> List[Tuple]:
     """Returns list of (id, name, count)"""
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("""
-        SELECT t.id, t.name, COUNT(it.item_id) as count
-        FROM tags t
-        JOIN item_tags it ON t.id = it.tag_id
-        JOIN items i ON it.item_id = i.id
-        WHERE i.deleted_at IS NULL
-        GROUP BY t.id, t.name
-        ORDER BY count DESC
-    """)
-    rows = c.fetchall()
-    conn.close()
-    return rows
-
-
-def get_items_by_tag(tag_id: int) -> List[Tuple]:
-    """Returns items for a specific tag."""
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("""
-        SELECT i.id, i.type, i.content, i.is_done, i.finish_date, i.alias, i.mood, i.date
-        FROM items i
-        JOIN item_tags it ON i.id = it.item_id
-        WHERE it.tag_id = ? AND i.deleted_at IS NULL
-        ORDER BY i.date
-    """, (tag_id,))
-    rows = c.fetchall()
-    conn.close()
-    return rows
+    with read_conn() as conn:
+        c = conn.cursor()
+        c.execute("""
+            SELECT t.id, t.name, COUNT(it.item_id) as count
+            FROM tags t
+            JOIN item_tags it ON t.id = it.tag_id
+            JOIN items i ON it.item_id = i.id
+            WHERE i.deleted_at IS NULL
+            GROUP BY t.id, t.name
+            ORDER BY count DESC
+        """)
+        rows = c.fetchall()
+        return rows
+
+
+def get_items_by_tag(tag_id: int, limit: int = 200, offset: int = 0) -> List[Tuple]:
+    """Returns one page of items for a specific tag, oldest first."""
+    with read_conn() as conn:
+        c = conn.cursor()
+        c.execute("""
+            SELECT i.id, i.type, i.content, i.is_done, i.finish_date, i.alias, i.mood, i.date
+            FROM items i
+            JOIN item_tags it ON i.id = it.item_id
+            WHERE it.tag_id = ? AND i.deleted_at IS NULL
+            ORDER BY i.date, i.id
+            LIMIT ? OFFSET ?
+        """, (tag_id, limit, offset))
+        rows = c.fetchall()
+        return rows
+
+
+def get_items_grouped_by_tag() -> Dict[int, List[Tuple]]:
+    """Returns {tag_id: items} for every tag, with the columns of get_items_by_tag."""
+    with read_conn() as conn:
+        c = conn.cursor()
+        c.execute("""
+            SELECT it.tag_id, i.id, i.type, i.content, i.is_done, i.finish_date, i.alias, i.mood, i.date
+            FROM items i
+            JOIN item_tags it ON i.id = it.item_id
+            WHERE i.deleted_at IS NULL
+            ORDER BY it.tag_id, i.date, i.id
+        """)
+        grouped = {}
+        for row in c.fetchall():
+            grouped.setdefault(row[0], []).append(row[1:])
+        return grouped
@@ -2,6 +2,7 @@ import typer
 import sys
 import os
 from pathlib import Path
+from typing import List
 from . import db, tui, config, output
 
 
@@ -14,11 +15,16 @@ app.add_typer(output.app, name="output")
 
 
 @app.command(rich_help_panel="Data Entry")
-def add(path: str, date: str = typer.Option(None, help="YYYY-MM-DD")):
-    """Add a file path to a date."""
-    abs_path = os.path.abspath(path)
-    db.add_item("file", abs_path, date)
-    print(f"Linked {abs_path} to {date or 'today'}")
+def add(paths: List[str], date: str = typer.Option(None, help="YYYY-MM-DD")):
+    """Add one or more file paths to a date."""
+    abs_paths = [os.path.abspath(path) for path in paths]
+    # One transaction (and one fsync) for the whole batch of files
+    with db.batched():
+        for abs_path in abs_paths:
+            db.add_item("file", abs_path, date)
+    # Only report once the batch has been committed
+    for abs_path in abs_paths:
+        print(f"Linked {abs_path} to {date or 'today'}")
 
 
 @app.command(rich_help_panel="Data Entry")
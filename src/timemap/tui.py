@@ -1,22 +1,59 @@
 from textual.app import App, ComposeResult
 from textual.containers import Grid, Vertical, Horizontal, Container, ScrollableContainer, VerticalScroll
-from textual.widgets import Header, Footer, Button, Label, ListView, ListItem, Input, TextArea, Select, Static
+from textual.widgets import Header, Footer, Button, Label, ListView, ListItem, Input, TextArea, Select, Static, DataTable
 from textual.screen import ModalScreen
 from textual.binding import Binding
 from textual import on, events, work
+from textual.worker import WorkerState
+import asyncio
 import tempfile
+from collections import OrderedDict
+from functools import lru_cache
 import calendar
 from datetime import date, timedelta, datetime
 import subprocess
 import os
 import re
 import shutil
+import sys
+import threading
+import time
 from pathlib import Path
-from textual_plotext import PlotextPlot
 from . import db, config
-import random
 import platform
 
+# MM-DD-YYYY typed into the command buffer, and [text](link) inside todos
+DATE_RE = re.compile(r"\A(\d{1,2})-(\d{1,2})-(\d{4})\Z")
+LINK_RE = re.compile(r'\[.*?\]\((.*?)\)')
+# First non-blank line, found without splitting the rest of the text
+FIRST_LINE_RE = re.compile(r"\s*([^\r\n]*)")
+
+# Locale names resolved once instead of on every calendar refresh
+DAY_ABBR = tuple(calendar.day_abbr)
+MONTH_NAMES = tuple(calendar.month_name)
+
+# CSS classes toggled on every refresh. Hyphenated literals are not
+# interned automatically, so intern them once for identity-fast set lookups.
+CLS_SELECTED = sys.intern("selected-day")
+CLS_EMPTY = sys.intern("empty-day")
+CLS_SIMPLE = sys.intern("simple")
+CLS_HAS_ITEMS = sys.intern("simple-has-items")
+CLS_TODO_DONE = sys.intern("todo-done")
+
+# Item icons; todos are keyed by their status
+TYPE_ICON = {'diary': "", 'note': "󰏪", 'todo_done': "",
+             'todo_pending': "󰆢", 'file': ""}
+
+# Openers that need a terminal window of their own
+TERM_APPS = frozenset(('nvim', 'vim', 'vi', 'nano', 'htop', 'less', 'top'))
+
+# Section titles in the details list; also the row_key of their HeaderItem
+TODO_HEADER = "── To Do List ──"
+DIARY_HEADER = "── Diaries ──"
+
+ONE_DAY = timedelta(days=1)
+ONE_WEEK = timedelta(weeks=1)
+
 # --- UTILS ---
 
 
@@ -36,7 +73,24 @@ def open_url(url):
         pass
 
 
+@lru_cache(maxsize=256)
+def month_matrix(year, month):
+    """calendar.monthcalendar() as an immutable, memoized tuple of weeks."""
+    return tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
+
+def _truncate(s, n=50):
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def _first_line(content, empty):
+    line = FIRST_LINE_RE.match(content).group(1).rstrip()
+    return _truncate(line) if line else empty
+
+
+@lru_cache(maxsize=1)
 def get_terminal_cmd():
+    # PATH lookups are done once per session
     terminals = ["kitty", "alacritty", "wezterm",
                  "gnome-terminal", "xfce4-terminal", "xterm"]
     env_term = os.environ.get("TERMINAL")
@@ -47,6 +101,22 @@ def get_terminal_cmd():
             return term
     return "x-terminal-emulator"
 
+
+def _write_temp(content):
+    fd, path = tempfile.mkstemp(suffix=".md")
+    with os.fdopen(fd, 'w') as f:
+        f.write(content)
+    return path
+
+
+def _read_and_remove(path):
+    # Read by path, not from a held fd: many editors save by writing a new
+    # file and renaming it over the old one.
+    with open(path, 'r') as f:
+        content = f.read().strip()
+    os.unlink(path)
+    return content
+
 # --- MODAL SCREENS ---
 
 
@@ -108,6 +178,16 @@ class FileAutocompleteScreen(ModalScreen):
     def __init__(self):
         super().__init__()
         self.current_path = os.getcwd()
+        # search_dir -> (checked_at, mtime, entries), most recently used last
+        self._dir_cache = OrderedDict()
+        self._dir_cache_lock = threading.Lock()
+        # (full_path, is_dir) pairs currently shown in the suggestion list
+        self._displayed = []
+        # Newest typed value; at most one scan runs, and a result for an
+        # older value is dropped in favour of rescanning the newest one
+        self._latest_query = None
+        self._scanning = False
+        self._timer = None
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -130,41 +210,115 @@ class FileAutocompleteScreen(ModalScreen):
 
     @on(Input.Changed, "#file-input")
     def on_input_change(self, event):
-        self.update_suggestions(event.value)
+        # Only look at the directory once typing pauses
+        self._latest_query = event.value
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self.set_timer(0.08, self.flush_suggestions)
+
+    def flush_suggestions(self):
+        self._timer = None
+        self.update_suggestions(self._latest_query)
 
     def update_suggestions(self, typed_value):
-        list_view = self.query_one("#file-suggestions", ListView)
-        list_view.clear()
+        self._latest_query = typed_value
+        if not self._scanning:
+            self._scanning = True
+            self.scan_suggestions(typed_value)
 
-        expanded_path = os.path.expanduser(typed_value)
+    @work(thread=True, group="fileglob")
+    def scan_suggestions(self, typed_value):
+        return typed_value, self.find_matches(typed_value)
 
-        if os.path.isdir(expanded_path) and typed_value.endswith('/'):
-            search_dir = expanded_path
-            partial = ""
+    def on_worker_state_changed(self, event):
+        if event.worker.group != "fileglob" or not event.worker.is_finished:
+            return
+        self._scanning = False
+        if event.state != WorkerState.SUCCESS:
+            return
+        query, matches = event.worker.result
+        if query != self._latest_query:
+            self.update_suggestions(self._latest_query)
         else:
-            search_dir = os.path.dirname(expanded_path)
-            partial = os.path.basename(expanded_path)
+            self.show_suggestions(matches)
 
-        if not os.path.exists(search_dir):
+    def show_suggestions(self, matches):
+        if matches == self._displayed:
             return
 
+        # Only replace the part of the list that actually changed
+        keep = 0
+        for old, new in zip(self._displayed, matches):
+            if old != new:
+                break
+            keep += 1
+
+        list_view = self.query_one("#file-suggestions", ListView)
+        if keep < len(self._displayed):
+            list_view.remove_items(range(keep, len(self._displayed)))
+        for full, is_dir in matches[keep:]:
+            label = os.path.basename(full) + ("/" if is_dir else "")
+            item = ListItem(Label(label), name=full)
+            # Remembered so selecting the suggestion needs no second stat
+            item.is_dir = is_dir
+            list_view.append(item)
+        self._displayed = matches
+
+    def find_matches(self, typed_value):
+        """Returns (full_path, is_dir) pairs completing the typed path."""
+        # "dir/" splits into ("dir", ""), so a trailing slash lists the
+        # directory itself without a separate isdir check.
+        expanded_path = os.path.expanduser(typed_value)
+        search_dir, partial = os.path.split(expanded_path)
+
         try:
-            items = sorted(os.listdir(search_dir))
-            matches = [i for i in items if i.startswith(
-                partial) and not i.startswith('.')]
-
-            for m in matches:
-                full = os.path.join(search_dir, m)
-                display = m + ("/" if os.path.isdir(full) else "")
-                list_view.append(ListItem(Label(display), name=full))
-        except PermissionError:
-            pass
+            # Missing paths, files and unreadable directories fail here
+            entries = self.list_dir(search_dir)
+        except OSError:
+            return []
+
+        return [(os.path.join(search_dir, name), is_dir)
+                for name, is_dir in entries if name.startswith(partial)]
+
+    def list_dir(self, search_dir):
+        """
+        Returns sorted (name, is_dir) pairs for the visible entries of a
+        directory. Listings of the last 32 directories are cached: reused
+        as-is for 2 seconds, then for as long as the mtime is unchanged.
+        """
+        now = time.monotonic()
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(search_dir)
+            if cached is not None:
+                self._dir_cache.move_to_end(search_dir)
+        if cached is not None:
+            checked_at, cached_mtime, entries = cached
+            if now - checked_at < 2.0:
+                return entries
+        mtime = os.path.getmtime(search_dir)
+        if cached is not None and mtime == cached_mtime:
+            with self._dir_cache_lock:
+                self._dir_cache[search_dir] = (now, mtime, entries)
+            return entries
+
+        # One scandir pass; DirEntry.is_dir() reuses the d_type the scan
+        # already returned instead of stat'ing every entry again.
+        with os.scandir(search_dir) as it:
+            entries = [(e.name, e.is_dir())
+                       for e in it if not e.name.startswith('.')]
+        entries.sort()
+
+        with self._dir_cache_lock:
+            self._dir_cache[search_dir] = (now, mtime, entries)
+            if len(self._dir_cache) > 32:
+                self._dir_cache.popitem(last=False)
+        return entries
 
     @on(ListView.Selected, "#file-suggestions")
     def on_suggestion_select(self, event):
         full_path = event.item.name
         input_box = self.query_one("#file-input", Input)
-        if os.path.isdir(full_path) and not full_path.endswith('/'):
+        if getattr(event.item, "is_dir", False) and not full_path.endswith('/'):
             full_path += "/"
         input_box.value = full_path
         input_box.focus()
@@ -250,12 +404,12 @@ class DiaryEditScreen(ModalScreen):
         ("☀ Sunny", "☀"),
         ("󰱯 Mysterious", "󰱯")
     ]
+    _VALID_MOODS = frozenset(m for _, m in MOOD_OPTIONS)
 
     def __init__(self, title: str, mood: str, content: str):
         super().__init__()
         self.initial_title = title
-        valid_moods = [m[1] for m in self.MOOD_OPTIONS]
-        self.initial_mood = mood if mood in valid_moods else Select.BLANK
+        self.initial_mood = mood if mood in self._VALID_MOODS else Select.BLANK
         self.initial_content = content
 
     def compose(self) -> ComposeResult:
@@ -311,10 +465,9 @@ class TextDetailScreen(ModalScreen):
         yield Container(
             Label(self.item_title, id="detail-title"),
             Label(self.meta_info, id="detail-meta") if self.meta_info else Label(""),
-            ScrollableContainer(
-                Label(self.item_content, id="detail-content"),
-                id="detail-scroll"
-            ),
+            # Scrolls itself and only renders the lines in view
+            TextArea(self.item_content or "", read_only=True,
+                     id="detail-content"),
             Button("Close", variant="primary", id="btn-close"),
             id="detail-dialog"
         )
@@ -498,6 +651,8 @@ class HelpScreen(ModalScreen):
                 Grid(
                     Label(
                         "d", classes="help-key"),     Label("Go to corresponding Date", classes="help-desc"),
+                    Label(
+                        "G (Shift+g)", classes="help-key"), Label("Load More Items (200 per page)", classes="help-desc"),
                     classes="help-grid"
                 ),
 
@@ -520,9 +675,11 @@ class StatsScreen(ModalScreen):
     def __init__(self, year: int):
         super().__init__()
         self.year = year
-        self.stats = db.get_year_stats(year)
+        self.stats = None
 
     def compose(self) -> ComposeResult:
+        # plotext is only loaded once the Stats screen is first opened
+        from textual_plotext import PlotextPlot
         yield Container(
             Label(f"Statistics for {self.year}", id="stats-title"),
             Grid(
@@ -541,6 +698,21 @@ class StatsScreen(ModalScreen):
         )
 
     def on_mount(self):
+        self.load_stats()
+
+    @work(thread=True, exclusive=True, group="stats")
+    def load_stats(self):
+        """Queries the year off the UI thread."""
+        stats = db.get_year_stats(self.year)
+        return stats, stats['total_todos'], stats['finished_todos']
+
+    def on_worker_state_changed(self, event):
+        if event.worker.group == "stats" and event.state == WorkerState.SUCCESS:
+            self.stats, t_created, t_done = event.worker.result
+            self.draw_plots(t_created, t_done)
+
+    def draw_plots(self, t_created, t_done):
+        from textual_plotext import PlotextPlot
         months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
         indices = list(range(len(months)))  # Use indices 0-11 for Line charts
@@ -561,8 +733,6 @@ class StatsScreen(ModalScreen):
 
         # 3. Todo Plot (Stacked Bar)
         # We pass a List of Lists [[done], [pending]] to satisfy plotext structure
-        t_created = sum(self.stats['todo_created'])
-        t_done = sum(self.stats['todo_done'])
         t_pending = max(0, t_created - t_done)
 
         p_todo = self.query_one("#plot-todo", PlotextPlot)
@@ -583,6 +753,8 @@ class StatsScreen(ModalScreen):
         p_file = self.query_one("#plot-file", PlotextPlot)
         p_file.plt.bar(months, self.stats['file'], color="yellow")
         p_file.plt.frame(False)
+        for plot in (p_diary, p_note, p_todo, p_file):
+            plot.refresh()
 
     def action_close(self):
         self.dismiss()
@@ -598,11 +770,13 @@ class TagInputScreen(ModalScreen):
         Binding("ctrl+s", "save", "Save"),
     ]
 
-    def __init__(self, item_id: int):
+    def __init__(self, item_id: int, current_tags=None):
         super().__init__()
         self.item_id = item_id
-        # Pre-fill with existing tags so user can edit them
-        current_tags = db.get_tags_for_item(item_id)
+        # Pre-fill with existing tags so user can edit them; callers that
+        # already hold the item's (name, color) pairs pass them in
+        if current_tags is None:
+            current_tags = db.get_tags_for_item(item_id)
         self.initial_value = ", ".join([t[0] for t in current_tags])
 
     def compose(self) -> ComposeResult:
@@ -660,32 +834,39 @@ class TagListScreen(ModalScreen):
         Binding("k", "up", "Up"),
     ]
 
-    def compose(self) -> ComposeResult:
-        tags = db.get_all_tags()
-        items = []
-        for t_id, t_name, count in tags:
-            items.append(
-                ListItem(Label(f"[{'cyan'}]{t_name}[/] ({count})"), name=str(t_id)))
+    def __init__(self):
+        super().__init__()
+        # Tag id of each table row, by row index
+        self.tag_ids = []
 
+    def compose(self) -> ComposeResult:
         yield Container(
             Label("All Tags (Press 'v' to filter, 'g' for Graph)", id="tag-title"),
-            ListView(*items, id="tag-list"),
+            DataTable(id="tag-list", cursor_type="row", show_header=False),
             Button("Close", id="btn-close"),
             id="tag-dialog"
         )
 
-    def on_mount(self): self.query_one(ListView).focus()
+    def on_mount(self):
+        # DataTable only renders the rows in view, however many tags exist
+        tags = db.get_all_tags()
+        self.tag_ids = [t_id for t_id, _, _ in tags]
+        table = self.query_one(DataTable)
+        table.add_column("Tag")
+        table.add_rows((f"[{'cyan'}]{t_name}[/] ({count})",)
+                       for _, t_name, count in tags)
+        table.focus()
 
     def action_down(self):
-        self.query_one(ListView).action_cursor_down()
+        self.query_one(DataTable).action_cursor_down()
 
     def action_up(self):
-        self.query_one(ListView).action_cursor_up()
+        self.query_one(DataTable).action_cursor_up()
 
     def action_view_items(self):
-        list_view = self.query_one(ListView)
-        if list_view.highlighted_child:
-            tag_id = int(list_view.highlighted_child.name)
+        table = self.query_one(DataTable)
+        if self.tag_ids:
+            tag_id = self.tag_ids[table.cursor_row]
 
             # Callback to handle the result from the filter screen
             def callback(result_date):
@@ -712,63 +893,75 @@ class TagFilterResultScreen(ModalScreen):
         Binding("v", "close", "Back"),
         Binding("q", "close", "Back"),
         Binding("d", "goto_date", "Go to Date"),  # New binding
+        Binding("G", "load_more", "Load More"),
         Binding("j", "down", "Down"),
         Binding("k", "up", "Up"),
     ]
 
+    PAGE_SIZE = 200
+
     def __init__(self, tag_id):
         super().__init__()
         self.tag_id = tag_id
+        # Date of each table row, by row index
+        self.row_dates = []
+        self._offset = 0
 
     def compose(self) -> ComposeResult:
-        items = db.get_items_by_tag(self.tag_id)
-        widgets = []
-
-        if not items:
-            widgets.append(ListItem(Label("No items found for this tag.")))
-        else:
-            for i in items:
-                _, type_, content, is_done, _, alias, _, date_str = i
-
-                display_text = ""
-                icon = "●"
-
-                if type_ == 'diary':
-                    icon = ""
-                    display_text = alias if alias else "Diary Entry"
-
-                elif type_ == 'note':
-                    icon = "󰏪"
-                    lines = content.strip().splitlines()
-                    first = lines[0] if lines else "Empty Note"
-                    display_text = (
-                        first[:50] + "...") if len(first) > 50 else first
-
-                elif type_ == 'todo':
-                    icon = "" if is_done else "󰆢"
-                    lines = content.strip().splitlines()
-                    first = lines[0] if lines else "Empty Todo"
-                    display_text = (
-                        first[:50] + "...") if len(first) > 50 else first
-
-                elif type_ == 'file':
-                    icon = ""
-                    display_text = alias if alias else os.path.basename(
-                        content)
-
-                label_str = f"[{'cyan'}]{date_str}[/] {icon} {display_text}"
-
-                widgets.append(ListItem(Label(label_str), name=date_str))
-
         yield Container(
-            Label("Tagged Items (Press 'd' to jump to date)", id="tag-title"),
-            ListView(*widgets, id="tag-filter-list"),
+            Label("Tagged Items (Press 'd' to jump to date, 'G' to load more)",
+                  id="tag-title"),
+            DataTable(id="tag-filter-list", cursor_type="row",
+                      show_header=False),
             Button("Back", id="btn-back"),
             id="tag-dialog"
         )
 
     def on_mount(self):
-        self.query_one("#tag-filter-list").focus()
+        table = self.query_one("#tag-filter-list", DataTable)
+        table.add_columns("Date", "Icon", "Item")
+        if not self.load_page():
+            table.add_row("", "", "No items found for this tag.")
+        table.focus()
+
+    def load_page(self):
+        """Appends the next page of tagged items; returns how many were added."""
+        items = db.get_items_by_tag(self.tag_id, self.PAGE_SIZE, self._offset)
+        self._offset += len(items)
+        self.row_dates.extend(i[7] for i in items)
+        self.query_one("#tag-filter-list", DataTable).add_rows(
+            self.format_rows(items))
+        return len(items)
+
+    def action_load_more(self):
+        if not self.row_dates or not self.load_page():
+            self.notify("No more items")
+
+    def format_rows(self, items):
+        """Yields the (date, icon, text) cells of each tagged item."""
+        for i in items:
+            _, type_, content, is_done, _, alias, _, date_str = i
+
+            display_text = ""
+            if type_ == 'todo':
+                icon = TYPE_ICON['todo_done' if is_done else 'todo_pending']
+            else:
+                icon = TYPE_ICON.get(type_, "●")
+
+            if type_ == 'diary':
+                display_text = alias if alias else "Diary Entry"
+
+            elif type_ == 'note':
+                display_text = _first_line(content, "Empty Note")
+
+            elif type_ == 'todo':
+                display_text = _first_line(content, "Empty Todo")
+
+            elif type_ == 'file':
+                display_text = alias if alias else os.path.basename(
+                    content)
+
+            yield f"[{'cyan'}]{date_str}[/]", icon, display_text
 
     def action_down(self):
         self.query_one("#tag-filter-list").action_cursor_down()
@@ -780,10 +973,10 @@ class TagFilterResultScreen(ModalScreen):
         self.dismiss(None)
 
     def action_goto_date(self):
-        # Retrieve the date stored in the highlighted item
-        list_view = self.query_one("#tag-filter-list", ListView)
-        if list_view.highlighted_child:
-            date_str = list_view.highlighted_child.name
+        # Retrieve the date of the highlighted row
+        if self.row_dates:
+            row = self.query_one("#tag-filter-list", DataTable).cursor_row
+            date_str = self.row_dates[row]
             if date_str:
                 self.dismiss(date_str)  # Return the date to the parent screen
 
@@ -803,6 +996,10 @@ class TagGraphScreen(ModalScreen):
         Binding("k", "scroll_up", "Up"),
     ]
 
+    COLOR = {'diary': 'magenta', 'note': 'green',
+             'todo': 'blue', 'file': 'yellow'}
+    MAX_ITEMS_PER_TAG = 50
+
     def compose(self) -> ComposeResult:
         yield Container(
             Label("Tag Knowledge Graph", id="graph-title"),
@@ -822,36 +1019,37 @@ class TagGraphScreen(ModalScreen):
 
     def generate_graph(self):
         tags = db.get_all_tags()
-        lines = []
-
-        lines.append("[bold yellow]★ ROOT[/]")
+        grouped = db.get_items_grouped_by_tag()
+
+        # One line for the root, one per tag, one per shown item and one
+        # "more" line for each tag over the cap
+        cap = self.MAX_ITEMS_PER_TAG
+        size = 1 + len(tags)
+        for t in tags:
+            n = len(grouped.get(t[0], ()))
+            size += min(n, cap) + (n > cap)
+        lines = [None] * size
+        lines[0] = "[bold yellow]★ ROOT[/]"
+        i = 1
 
         for t_id, t_name, _ in tags:
-            lines.append(f"  └── [bold cyan]■ {t_name}[/]")
-
-            items = db.get_items_by_tag(t_id)
-
-            for idx, item in enumerate(items):
-                is_last = (idx == len(items) - 1)
-                prefix = "      "
-                connector = "└──" if is_last else "├──"
-
-                itype = item[1]
-                color = "white"
-                if itype == 'diary':
-                    color = "magenta"
-                elif itype == 'note':
-                    color = "green"
-                elif itype == 'todo':
-                    color = "blue"
-                elif itype == 'file':
-                    color = "yellow"
+            lines[i] = f"  └── [bold cyan]■ {t_name}[/]"
+            i += 1
 
-                name = item[5] if item[5] else item[2][:20]
-                date_str = item[7]
+            items = grouped.get(t_id, [])
+            hidden = len(items) - cap
+            shown = items[:cap] if hidden > 0 else items
+            last = len(shown) - 1 if hidden <= 0 else -1
 
-                node = f"{prefix}{connector} [{color}]● {date_str}: {name}[/]"
-                lines.append(node)
+            for idx, item in enumerate(shown):
+                connector = "└──" if idx == last else "├──"
+                color = self.COLOR.get(item[1], "white")
+                name = item[5] if item[5] else item[2][:20]
+                lines[i] = f"      {connector} [{color}]● {item[7]}: {name}[/]"
+                i += 1
+            if hidden > 0:
+                lines[i] = f"      └── [dim]… (+{hidden} more)[/]"
+                i += 1
 
         return "\n".join(lines)
 
@@ -859,8 +1057,52 @@ class TagGraphScreen(ModalScreen):
     def on_close(self): self.dismiss()
 
 
+def _fmt_file(content, is_done, finish_date, alias, date_str):
+    return TYPE_ICON['file'], alias or os.path.basename(content), False
+
+
+def _fmt_note(content, is_done, finish_date, alias, date_str):
+    return TYPE_ICON['note'], content, False
+
+
+def _fmt_diary(content, is_done, finish_date, alias, date_str):
+    return TYPE_ICON['diary'], alias or f"{date_str} Diary", False
+
+
+def _fmt_todo(content, is_done, finish_date, alias, date_str):
+    if not is_done:
+        return TYPE_ICON['todo_pending'], content, False
+    if finish_date:
+        try:
+            dt = date.fromisoformat(finish_date)
+            content = f"{content} [{dt.strftime('%m/%d/%Y')}]"
+        except ValueError:
+            pass
+    return TYPE_ICON['todo_done'], content, True
+
+
+def _fmt_other(content, is_done, finish_date, alias, date_str):
+    return "", alias or content, False
+
+
+@lru_cache(maxsize=256)
+def _fmt_tag(name, color):
+    """Tag markup for the details list; the same tags repeat across items."""
+    return f"[{color} bold]({name})[/] "
+
+
+# type -> formatter returning (icon, display_text, should_strike)
+_TYPE_DISPATCH = {
+    'file': _fmt_file,
+    'note': _fmt_note,
+    'diary': _fmt_diary,
+    'todo': _fmt_todo,
+}
+
+
 class DetailItem(ListItem):
-    def __init__(self, item_id, type, content, is_done=False, finish_date=None, alias=None, mood=None, date_str=None):
+    # Parameters follow the column order of db.get_items_for_date()
+    def __init__(self, item_id, type, content, is_done=False, finish_date=None, alias=None, mood=None, date_str=None, tags=None):
         self.item_id = item_id
         self.type = type
         self.content = content
@@ -870,50 +1112,35 @@ class DetailItem(ListItem):
         self.mood = mood
         self.date_str = date_str
 
-        icon = ""
-        display_text = alias if alias else content
-        should_strike = False
-
-        if type == 'file':
-            icon = ""
-            if not alias:
-                display_text = os.path.basename(content)
-        elif type == 'note':
-            icon = "󰏪"
-            display_text = content
-        elif type == 'diary':
-            icon = ""
-            if not alias:
-                display_text = f"{date_str} Diary"
-        elif type == 'todo':
-            display_text = content
-            if is_done:
-                icon = ""
-                should_strike = True
-                if finish_date:
-                    try:
-                        dt = date.fromisoformat(finish_date)
-                        display_text += f" [{dt.strftime('%m/%d/%Y')}]"
-                    except ValueError:
-                        pass
-            else:
-                icon = "󰆢"
+        icon, display_text, should_strike = _TYPE_DISPATCH.get(
+            type, _fmt_other)(content, is_done, finish_date, alias, date_str)
 
-        tags = db.get_tags_for_item(item_id)
-        tag_str = ""
-        if tags:
-            # Format: "[tag1] [tag2] "
-            for t_name, t_color in tags:
-                tag_str += f"[{t_color} bold]({t_name})[/] "
+        # (name, color) pairs; callers may pass them in to skip the query
+        if tags is None:
+            tags = db.get_tags_for_item(item_id)
+        self.tags = tags
+        # Everything the row shows; equal keys mean the widget can be kept
+        self.row_key = (item_id, type, content, is_done, finish_date, alias,
+                        mood, date_str, tuple(tags))
+        # Format: "[tag1] [tag2] "
+        tag_str = "".join(_fmt_tag(t_name, t_color) for t_name, t_color in tags)
 
         super().__init__(Label(f"{icon} {tag_str} {display_text}"))
         if should_strike:
-            self.add_class("todo-done")
+            self.add_class(CLS_TODO_DONE)
 
 
 class HeaderItem(ListItem):
     def __init__(self, title):
         super().__init__(Label(title), classes="list-header", disabled=True)
+        self.row_key = title
+
+
+def make_detail_row(row_key):
+    """Builds the details-list widget for a row_key (a header title or item)."""
+    if isinstance(row_key, str):
+        return HeaderItem(row_key)
+    return DetailItem(*row_key)
 
 
 class ActionListView(ListView):
@@ -942,6 +1169,39 @@ class ActionListView(ListView):
         Binding("C", "show_tags", "Tags", show=False),
     ]
 
+    # Rows are mounted in batches as the cursor or scroll nears the end
+    RENDER_BATCH = 40
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pending_keys = []
+
+    def render_more(self):
+        batch = self.pending_keys[:self.RENDER_BATCH]
+        del self.pending_keys[:self.RENDER_BATCH]
+        self.extend(make_detail_row(k) for k in batch)
+
+    def fill_viewport(self):
+        """Renders pending rows until they cover the list's height."""
+        # Every row is at least one line tall, so this many rows fill it;
+        # past that the list scrolls and watch_scroll_y takes over
+        while self.pending_keys and len(self) < self.size.height:
+            self.render_more()
+
+    def on_resize(self, event: events.Resize):
+        self.fill_viewport()
+
+    def watch_index(self, old_index, new_index):
+        super().watch_index(old_index, new_index)
+        if (self.pending_keys and new_index is not None
+                and new_index >= len(self) - 5):
+            self.render_more()
+
+    def watch_scroll_y(self, old_value, new_value):
+        super().watch_scroll_y(old_value, new_value)
+        if self.pending_keys and new_value >= self.max_scroll_y - 2:
+            self.render_more()
+
     def action_unfocus_list(self): self.app.action_focus_calendar()
 
     def action_open_default(self):
@@ -1010,52 +1270,62 @@ class ActionListView(ListView):
         if isinstance(item, DetailItem):
             def callback(refresh):
                 if refresh:
-                    self.app.refresh_ui()
-            self.app.push_screen(TagInputScreen(item.item_id), callback)
+                    self.app.refresh_details_only()
+            self.app.push_screen(
+                TagInputScreen(item.item_id, item.tags), callback)
 
 
 class CalendarDay(Vertical):
     """
     Handles both 'Detailed' (4-corner) and 'Simple' (Color) views.
+    Cells are mounted once and refilled by update() for every month shown.
     """
     can_focus = True  # Necessary to allow keyboard navigation like a Button
 
-    def __init__(self, day_num: int, current_year: int, current_month: int, stats: dict, simple_mode: bool):
+    def __init__(self):
+        super().__init__(classes=CLS_EMPTY, disabled=True)
+        self.day_num = 0
+        self.stats = {}
+        self.simple_mode = False
+        self.full_date = None
+        self.has_items = False
+        self.diary_label = Label(" ", classes="corner-icon left red")
+        self.todo_label = Label(" ", classes="corner-icon right blue")
+        self.num_label = Label("", classes="day-num day-center")
+        self.file_label = Label(" ", classes="corner-icon left yellow")
+        self.note_label = Label(" ", classes="corner-icon right green")
+        self.simple_label = Label("", classes="day-num-simple day-center-simple")
+
+    def compose(self) -> ComposeResult:
+        yield Horizontal(self.diary_label, self.todo_label,
+                         classes="day-row top")
+        # Center: Day Number
+        yield self.num_label
+        # Bottom Left: File+Count | Bottom Right: Note Icon+Count
+        yield Horizontal(self.file_label, self.note_label,
+                         classes="day-row bottom")
+        # Only shown in simple mode
+        yield self.simple_label
+
+    def update(self, day_num: int, current_year: int, current_month: int, stats: dict, simple_mode: bool):
+        """Shows the given day (0 for a blank cell) in this cell."""
         self.day_num = day_num
         self.stats = stats
         self.simple_mode = simple_mode
-        try:
-            self.full_date = date(current_year, current_month, day_num)
-        except ValueError:
-            self.full_date = None
-
-        id_str = f"day-{day_num}" if day_num > 0 else None
-        super().__init__(id=id_str)
-
-        if day_num == 0:
-            self.disabled = True
-            self.add_class("empty-day")
-
-        count_sum = (
-            stats.get('diary', 0) +
-            stats.get('file', 0) +
-            stats.get('todo', 0) +
-            stats.get('note', 0)
-        )
-        self.has_items = count_sum > 0
+        self.full_date = date(
+            current_year, current_month, day_num) if day_num else None
 
-        if self.simple_mode and self.has_items and day_num > 0:
-            self.add_class("simple-has-items")
+        self.has_items = stats.get('_total', 0) > 0
 
-    def compose(self) -> ComposeResult:
-        if self.day_num == 0:
-            return
+        self.disabled = day_num == 0
+        self.set_class(day_num == 0, CLS_EMPTY)
+        self.set_class(simple_mode, CLS_SIMPLE)
+        self.set_class(simple_mode and self.has_items and day_num > 0,
+                       CLS_HAS_ITEMS)
 
-        if self.simple_mode:
-            yield Container(
-                Label(str(self.day_num), classes="day-num-simple"),
-                classes="day-center-simple"
-            )
+        num_str = str(day_num) if day_num else ""
+        if simple_mode:
+            self.simple_label.update(num_str)
             return
 
         has_diary = self.stats.get('diary', 0) > 0
@@ -1068,27 +1338,17 @@ class CalendarDay(Vertical):
         todo_count = self.stats.get('todo', 0)
         todo_str = f"{todo_count}" if todo_count > 0 else " "
 
-        yield Horizontal(
-            Label(diary_icon, classes="corner-icon left red"),
-            Label(todo_str, classes="corner-icon right blue"),
-            classes="day-row top"
-        )
-
-        # Center: Day Number
-        yield Container(Label(str(self.day_num), classes="day-num"), classes="day-center")
-
-        # Bottom Left: File+Count | Bottom Right: Note Icon+Count
         file_count = self.stats.get('file', 0)
         file_str = f"{file_count}" if file_count > 0 else " "
 
         note_count = self.stats.get('note', 0)
         note_str = f"󰏪{note_count}" if note_count > 0 else " "
 
-        yield Horizontal(
-            Label(file_str, classes="corner-icon left yellow"),
-            Label(note_str, classes="corner-icon right green"),
-            classes="day-row bottom"
-        )
+        self.diary_label.update(diary_icon)
+        self.todo_label.update(todo_str)
+        self.num_label.update(num_str)
+        self.file_label.update(file_str)
+        self.note_label.update(note_str)
 
     def on_click(self):
         if self.full_date:
@@ -1114,15 +1374,17 @@ class TimeMapApp(App):
     .selected-day { background: $primary; color: $text; text-style: bold; }
 
     .day-row { height: auto; width: 100%; layout: horizontal; padding: 0 1;}
-    .day-center { height: auto; width: 100%; align: center middle; padding: 0; margin: 0}
+    .day-center { height: auto; width: 100%; content-align: center middle; padding: 0; margin: 0}
     .day-num { text-style: bold; }
     .corner-icon { width: 1fr; }
     .left { text_align: left; } .right { text_align: right; }
     .red { color: #f8c8dc; } .blue { color: #8be9fd; } 
     .yellow { color: #f1fa8c; } .green { color: #50fa7b; }
 
-    .day-center-simple { width: 100%; height: 100%; align: center middle; }
+    .day-center-simple { width: 100%; height: 1fr; content-align: center middle; }
     .day-num-simple { text-style: bold; }
+    .day-center-simple, .simple .day-row, .simple .day-center { display: none; }
+    .simple .day-center-simple { display: block; }
     .simple-has-items { background: $accent-darken-2; color: $text-accent; text-style: bold; }
     .selected-day.simple-has-items { background: $primary; color: $text; }    
 
@@ -1145,8 +1407,7 @@ class TimeMapApp(App):
     #input-content, #note-content { height: 1fr; border: solid $secondary; margin-top: 1; }
     #file-suggestions { height: 1fr; border: solid $secondary; margin-top: 1; background: $surface-lighten-1; }
 
-    #detail-scroll { height: 1fr; border: solid $secondary; padding: 1; margin: 1 0; background: $surface-lighten-1; }
-    #detail-content { width: 100%; height: auto; }
+    #detail-content { width: 100%; height: 1fr; border: solid $secondary; padding: 0 1; margin: 1 0; background: $surface-lighten-1; }
     #detail-title { text-style: bold; content-align: center middle; width: 100%; border-bottom: solid $primary; padding-bottom: 1; }
     #detail-meta { color: $secondary; content-align: center middle; width: 100%; margin-top: 1; margin-bottom: 1; }
     
@@ -1243,6 +1504,7 @@ class TimeMapApp(App):
         width: 100%; text-align: center; text-style: bold; 
         border-bottom: solid $primary; margin-bottom: 1;
     }
+    #tag-list, #tag-filter-list { height: 1fr; }
     #graph-area { height: 1fr; border: solid $secondary; padding: 1; overflow: auto; }
     """
 
@@ -1276,11 +1538,41 @@ class TimeMapApp(App):
 
     def __init__(self):
         super().__init__()
-        self.current_date_obj = date.today()
+        # Cached date.today() and the local midnight that ends it
+        self._today = None
+        self._today_midnight = datetime.min
+        self.current_date_obj = self.today
         self.display_year = self.current_date_obj.year
         self.display_month = self.current_date_obj.month
         self.cmd_buffer = ""
         self.simple_view = False
+        # (year, month) -> db.get_month_stats(), most recently used last;
+        # valid while the database version still equals _month_stats_version
+        self._month_stats_cache = OrderedDict()
+        self._month_stats_version = None
+        # Six weeks of cells, mounted once and refilled for each month
+        self._day_cells = [CalendarDay() for _ in range(42)]
+        # Date -> CalendarDay for the month currently rendered in the grid
+        self._day_widgets = {}
+        self._selected_day_widget = None
+        # Date shown before the current burst of moves, and its redraw timer
+        self._pending_date = None
+        self._redraw_timer = None
+        # Month/year changes and writes, coalesced into one refresh
+        self._refresh_handle = None
+        self._refresh_details = False
+        self._details_date = None
+
+    @property
+    def today(self):
+        """date.today(), re-read only once the cached day has ended."""
+        # Compared against the wall clock, so suspend, clock changes and
+        # DST shifts are picked up on the next call
+        if datetime.now() >= self._today_midnight:
+            self._today = date.today()
+            self._today_midnight = datetime.combine(
+                self._today + ONE_DAY, datetime.min.time())
+        return self._today
 
     def call_from_child(self, clicked_date):
         self.run_worker(self.change_selected_date(clicked_date))
@@ -1289,7 +1581,7 @@ class TimeMapApp(App):
         self.simple_view = not self.simple_view
         mode_str = "Simple Mode" if self.simple_view else "Detailed Mode"
         self.notify(f"Switched to {mode_str}")
-        self.run_worker(self.refresh_calendar())
+        self.schedule_refresh()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1306,10 +1598,17 @@ class TimeMapApp(App):
                                classes="nav-btn-year"),
                         id="cal-header"
                     ),
-                    Container(Grid(id="calendar-grid"), id="grid-container"),
+                    Container(
+                        Grid(*[Label(d, classes="day-header") for d in DAY_ABBR],
+                             *self._day_cells, id="calendar-grid"),
+                        id="grid-container"),
                     id="calendar-area"
                 ),
-                Vertical(Label("Select a date..."), id="details-panel"),
+                Vertical(
+                    Label("Select a date...", id="details-title"),
+                    Label("No items found.", id="details-empty"),
+                    ActionListView(id="details-list"),
+                    id="details-panel"),
                 id="content-area"
             ),
             Label("Ready.", id="status-bar"),
@@ -1318,8 +1617,14 @@ class TimeMapApp(App):
         yield Footer()
 
     async def on_mount(self):
-        await self.refresh_calendar()
-        self.show_details()
+        # One warm connection shared by the calendar and details panel
+        self._db_conn = db.get_read_conn()
+        self._month_label = self.query_one("#month-label", Label)
+        self._status_bar = self.query_one("#status-bar", Label)
+        self._details_title = self.query_one("#details-title", Label)
+        self._details_empty = self.query_one("#details-empty", Label)
+        self._details_list = self.query_one("#details-list", ActionListView)
+        await self.redraw(full_month=True)
 
     def on_key(self, event: events.Key):
         if event.character and event.character in "0123456789-":
@@ -1337,7 +1642,7 @@ class TimeMapApp(App):
                 self.update_status("Ready.")
 
     def update_status(self, msg):
-        self.query_one("#status-bar", Label).update(msg)
+        self._status_bar.update(msg)
 
     # --- ACTION HANDLERS ---
 
@@ -1372,7 +1677,7 @@ class TimeMapApp(App):
             db.add_item("file", os.path.abspath(
                 os.path.expanduser(path)), date_str)
             self.notify(f"Linked file to {date_str}")
-            self.refresh_ui()
+            self.refresh_current_day()
         elif path:
             self.notify("File not found!", severity="error")
 
@@ -1380,7 +1685,7 @@ class TimeMapApp(App):
         if content:
             db.add_item("note", content, date_str)
             self.notify("Note added")
-            self.refresh_ui()
+            self.refresh_current_day()
 
     def create_todo_item(self, content):
         if content:
@@ -1393,11 +1698,48 @@ class TimeMapApp(App):
             db.add_item("diary", result['content'], date_str,
                         alias=result['title'], mood=result['mood'])
             self.notify("Diary entry created")
-            self.refresh_ui()
+            self.refresh_current_day()
 
     def refresh_ui(self):
+        self.schedule_refresh(details=True)
+
+    def refresh_details_only(self):
+        """For changes that do not affect the calendar, e.g. tags."""
+        self.show_details()
+
+    def refresh_current_day_cell(self):
+        """Re-renders only the selected cell after a change to its date."""
+        cell = self._selected_day_widget
+        if cell is None:
+            return
+        d = cell.full_date
+        stats = self.get_month_stats(d.year, d.month)
+        cell.update(d.day, d.year, d.month, stats.get(d.day, {}),
+                    self.simple_view)
+
+    def refresh_current_day(self):
+        """Refresh after a change to one non-todo item on the selected date.
+
+        Todos are counted on every day they stay open, so any todo change
+        needs the whole calendar via refresh_ui().
+        """
+        self.refresh_current_day_cell()
         self.show_details()
-        self.run_worker(self.refresh_calendar())
+
+    def schedule_refresh(self, details=False):
+        """Refreshes the calendar (and details) once a burst of calls settles."""
+        self._refresh_details |= details
+        if self._refresh_handle is not None:
+            self._refresh_handle.stop()
+        self._refresh_handle = self.set_timer(0.08, self._do_refresh)
+
+    async def _do_refresh(self):
+        self._refresh_handle = None
+        details, self._refresh_details = self._refresh_details, False
+        if details:
+            await self.redraw(full_month=True)
+        else:
+            await self.refresh_calendar()
 
     async def action_go_day(self):
         if self.cmd_buffer.isdigit():
@@ -1415,10 +1757,11 @@ class TimeMapApp(App):
             self.update_status("Ready.")
 
     async def action_go_date(self):
-        if re.match(r"\d{1,2}-\d{1,2}-\d{4}", self.cmd_buffer):
+        m = DATE_RE.match(self.cmd_buffer)
+        if m:
             try:
-                parts = self.cmd_buffer.split('-')
-                new_date = date(int(parts[2]), int(parts[0]), int(parts[1]))
+                new_date = date(int(m.group(3)), int(m.group(1)),
+                                int(m.group(2)))
                 self.cmd_buffer = ""
                 self.update_status(f"Jumped to {new_date}")
                 await self.change_selected_date(new_date)
@@ -1430,31 +1773,34 @@ class TimeMapApp(App):
             self.cmd_buffer = ""
 
     def action_focus_list(self):
-        try:
-            list_view = self.query_one("ActionListView", ActionListView)
+        list_view = self._details_list
+        if list_view.display:
             list_view.focus()
             self.update_status("List Focused (j/k to move)")
-        except Exception:
+        else:
             self.notify("List is empty or not available")
 
     def action_focus_calendar(self):
-        grid = self.query_one("#calendar-grid", Grid)
-        for child in grid.children:
-            if "selected-day" in child.classes:
-                child.focus()
-                self.update_status("Calendar Focused")
-                break
+        if self._selected_day_widget:
+            self._selected_day_widget.focus()
+            self.update_status("Calendar Focused")
 
     def action_remove_item(self, item):
         db.delete_item(item.item_id)
-        self.refresh_ui()
+        self.refresh_item_change(item)
         self.notify("Item removed")
 
     def action_soft_delete_item(self, item):
         db.soft_delete_item(item.item_id)
-        self.refresh_ui()
+        self.refresh_item_change(item)
         self.notify("Item moved to Trash (only stores 3 most recent files)")
 
+    def refresh_item_change(self, item):
+        if item.type == 'todo':
+            self.refresh_ui()
+        else:
+            self.refresh_current_day()
+
     def action_recover_item(self):
         success = db.recover_last_deleted()
         if success:
@@ -1484,9 +1830,12 @@ class TimeMapApp(App):
                 f"Edit {item.type}:", item.content), callback)
 
     def action_edit_external(self, item):
-        with tempfile.NamedTemporaryFile(suffix=".md", delete=False, mode='w+') as tf:
-            tf.write(item.content or "")
-            tf_path = tf.name
+        self.run_worker(self.edit_external(item))
+
+    async def edit_external(self, item):
+        # Temp file and database I/O run off the event loop; only the
+        # editor itself needs the suspended terminal.
+        tf_path = await asyncio.to_thread(_write_temp, item.content or "")
         with self.suspend():
             editor = config.get_editor()
             try:
@@ -1494,17 +1843,17 @@ class TimeMapApp(App):
             except FileNotFoundError:
                 print(f"Error: Editor '{editor}' not found")
                 input("Press Enter to continue...")
-        with open(tf_path, 'r') as f:
-            new_content = f.read().strip()
-        os.unlink(tf_path)
+        new_content = await asyncio.to_thread(_read_and_remove, tf_path)
         if new_content != item.content:
             if item.type == 'diary':
                 current_title = item.alias or ""
                 current_mood = item.mood or ""
-                db.update_diary_item(
-                    item.item_id, current_title, current_mood, new_content)
+                await asyncio.to_thread(
+                    db.update_diary_item, item.item_id, current_title,
+                    current_mood, new_content)
             else:
-                db.update_item_content(item.item_id, new_content)
+                await asyncio.to_thread(
+                    db.update_item_content, item.item_id, new_content)
             self.show_details()
             self.notify(f"Updated {item.type} externally")
 
@@ -1532,9 +1881,9 @@ class TimeMapApp(App):
             if cmd in ["start", "xdg-open", "open"]:
                 open_url(item.content)
             else:
-                self.open_file(item.content, cmd)
+                self.run_worker(self.open_file(item.content, cmd))
         elif item.type == 'todo':
-            match = re.search(r'\[.*?\]\((.*?)\)', item.content)
+            match = LINK_RE.search(item.content)
             if match:
                 link = match.group(1)
                 open_url(link)
@@ -1559,16 +1908,17 @@ class TimeMapApp(App):
 
     def action_open_custom(self):
         try:
-            list_view = self.query_one("ActionListView", ActionListView)
+            list_view = self._details_list
             if list_view.has_focus and isinstance(list_view.highlighted_child, DetailItem):
                 item = list_view.highlighted_child
                 if item and item.type == 'file':
                     def callback(method):
                         if method == "CUSTOM":
-                            self.push_screen(InputScreen("Enter command:"), lambda cmd: self.open_file(
-                                item.content, cmd) if cmd else None)
+                            self.push_screen(InputScreen("Enter command:"), lambda cmd: self.run_worker(
+                                self.open_file(item.content, cmd)) if cmd else None)
                         elif method:
-                            self.open_file(item.content, method)
+                            self.run_worker(
+                                self.open_file(item.content, method))
                     self.push_screen(OpenMethodScreen(), callback)
         except Exception:
             pass
@@ -1590,174 +1940,274 @@ class TimeMapApp(App):
 
         self.app.push_screen(TagListScreen(), callback)
 
-    def open_file(self, path, command):
-        if not os.path.exists(path):
+    async def open_file(self, path, command):
+        # Stat and spawn in a thread: a slow (network/FUSE) mount must not
+        # stall the event loop.
+        if not await asyncio.to_thread(os.path.exists, path):
             self.notify("File missing", severity="error")
             return
         clean_env = config.get_system_env()
         if platform.system() == "Windows":
             try:
-                subprocess.Popen([command, path], shell=True, env=clean_env)
+                await asyncio.to_thread(
+                    subprocess.Popen, [command, path], shell=True, env=clean_env)
             except FileNotFoundError:
                 self.notify(f"Command '{command}' not found", severity="error")
             return
         cmd_list = [command, path]
-        term_apps = ['nvim', 'vim', 'vi', 'nano', 'htop', 'less', 'top']
-        if os.path.basename(command) in term_apps:
+        if os.path.basename(command) in TERM_APPS:
             term = get_terminal_cmd()
             cmd_list = [term, "-e", command, path]
         try:
-            subprocess.Popen(cmd_list, start_new_session=True,
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                             env=clean_env)
+            await asyncio.to_thread(
+                subprocess.Popen, cmd_list, start_new_session=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                env=clean_env)
         except FileNotFoundError:
             self.notify(f"Command '{command}' not found", severity="error")
 
     def action_show_help(self): self.push_screen(HelpScreen())
 
     async def refresh_calendar(self):
-        month_name = calendar.month_name[self.display_month]
-        self.query_one(
-            "#month-label", Label).update(f"{month_name} {self.display_year}")
-        grid = self.query_one("#calendar-grid", Grid)
-        await grid.remove_children()
-        for d in calendar.day_abbr:
-            grid.mount(Label(d, classes="day-header"))
+        year, month = self.display_year, self.display_month
+        cal = month_matrix(year, month)
+        stats = self.get_month_stats(year, month)
+        cur = self.current_date_obj
+        sel_day = cur.day if (cur.year, cur.month) == (year, month) else -1
 
-        cal = calendar.monthcalendar(self.display_year, self.display_month)
-        stats = db.get_month_stats(self.display_year, self.display_month)
+        self._month_label.update(f"{MONTH_NAMES[month]} {year}")
 
+        # Refill the mounted cells in place; rows past the month's last
+        # week are hidden rather than removed.
+        day_widgets = {}
         day_to_focus = None
-        for week in cal:
-            for day in week:
-                day_stats = stats.get(day, {})
-                widget = CalendarDay(
-                    day, self.display_year, self.display_month, day_stats, self.simple_view)
-
-                if day != 0:
-                    if date(self.display_year, self.display_month, day) == self.current_date_obj:
-                        widget.add_class("selected-day")
-                        day_to_focus = widget
-                grid.mount(widget)
+        cells = iter(self._day_cells)
+        blank_week = (0,) * 7
+        for row in range(6):
+            in_month = row < len(cal)
+            for day in (cal[row] if in_month else blank_week):
+                cell = next(cells)
+                cell.update(day, year, month, stats.get(day, {}),
+                            self.simple_view)
+                cell.set_class(day == sel_day, CLS_SELECTED)
+                cell.display = in_month
+                if day:
+                    day_widgets[cell.full_date] = cell
+                if day == sel_day:
+                    day_to_focus = cell
+        self._day_widgets = day_widgets
+        self._selected_day_widget = day_to_focus
+
+        self.focus_day(day_to_focus)
+
+    def focus_day(self, widget):
+        """Focuses a calendar cell unless the user is working in the list."""
+        if widget and not self._details_list.has_focus:
+            widget.focus()
+
+    def move_selection(self, old_date, new_date):
+        """Moves the selected-day highlight between two cells of the shown month."""
+        old_widget = self._day_widgets.get(old_date)
+        if old_widget:
+            old_widget.remove_class(CLS_SELECTED)
+        new_widget = self._day_widgets[new_date]
+        new_widget.add_class(CLS_SELECTED)
+        self._selected_day_widget = new_widget
+        self.focus_day(new_widget)
+
+    def get_month_stats(self, year, month):
+        """Returns db.get_month_stats(), cached for the last 12 months shown."""
+        # DATA_VERSION covers our own writes; data_version also sees
+        # commits from other processes such as the CLI
+        version = (db.DATA_VERSION, db.data_version(self._db_conn))
+        if self._month_stats_version != version:
+            # Todos span every month from creation to completion, so a
+            # single write can change the stats of many months: drop them all.
+            self._month_stats_cache.clear()
+            self._month_stats_version = version
+        key = (year, month)
+        stats = self._month_stats_cache.get(key)
+        if stats is None:
+            stats = db.get_month_stats(year, month, self._db_conn)
+            self._month_stats_cache[key] = stats
+            if len(self._month_stats_cache) > 12:
+                self._month_stats_cache.popitem(last=False)
+        else:
+            self._month_stats_cache.move_to_end(key)
+        return stats
+
+    def show_details(self):
+        """Reloads the details panel for current_date_obj in the background."""
+        self.run_worker(self.load_details(), exclusive=True, group="details")
 
+    @staticmethod
+    def fetch_details(target_date_str):
         try:
-            if not self.query_one("ActionListView").has_focus and day_to_focus:
-                day_to_focus.focus()
+            with db.read_conn() as conn:
+                items = db.get_items_for_date(target_date_str, conn)
+                # One query for the tags of every item instead of one per item
+                tags_by_id = db.get_tags_for_items(
+                    [i['id'] for i in items], conn)
         except Exception:
-            if day_to_focus:
-                day_to_focus.focus()
+            items, tags_by_id = [], {}
+        return items, tags_by_id
 
-    def show_details(self):
+    async def load_details(self):
+        # Queries run in a thread so a busy date doesn't stall key handling;
+        # a newer load cancels this one before it touches the list.
         target_date_str = self.current_date_obj.isoformat()
-        panel = self.query_one("#details-panel")
-        panel.remove_children()
-        panel.mount(Label(f"Items for {target_date_str}:"))
-        try:
-            items = db.get_items_for_date(target_date_str)
-        except Exception:
-            items = []
+        items, tags_by_id = await asyncio.to_thread(
+            self.fetch_details, target_date_str)
 
-        date_items = [i for i in items if i[1] != 'todo' and i[1] != 'diary']
-        todo_items = [i for i in items if i[1] == 'todo']
-        diary_items = [i for i in items if i[1] == 'diary']
+        date_items, todo_items, diary_items = [], [], []
+        buckets = {'todo': todo_items, 'diary': diary_items}
+        for i in items:
+            buckets.get(i['type'], date_items).append(i)
 
-        todo_items.sort(key=lambda x: x[3])
+        def row_keys(rows):
+            for i in rows:
+                yield (*i, target_date_str, tuple(tags_by_id.get(i['id'], ())))
 
-        widgets = []
-        for i in date_items:
-            widgets.append(DetailItem(
-                i[0], i[1], i[2], i[3], i[4], i[5], i[6], target_date_str))
+        keys = list(row_keys(date_items))
         if todo_items:
-            widgets.append(HeaderItem("── To Do List ──"))
-            for i in todo_items:
-                widgets.append(DetailItem(
-                    i[0], i[1], i[2], i[3], i[4], i[5], i[6], target_date_str))
+            keys.append(TODO_HEADER)
+            keys.extend(row_keys(todo_items))
         if diary_items:
-            widgets.append(HeaderItem("── Diaries ──"))
-            for i in diary_items:
-                widgets.append(DetailItem(
-                    i[0], i[1], i[2], i[3], i[4], i[5], i[6], target_date_str))
-
-        if not widgets:
-            panel.mount(Label("No items found."))
+            keys.append(DIARY_HEADER)
+            keys.extend(row_keys(diary_items))
+
+        self._details_title.update(f"Items for {target_date_str}:")
+        self._details_empty.display = not keys
+        list_view = self._details_list
+        list_view.display = bool(keys)
+
+        # Only replace the run of rows that actually changed, so a toggle or
+        # rename rebuilds one widget and keeps the cursor where it was
+        old = list(list_view.children)
+        same_date = self._details_date == target_date_str
+        self._details_date = target_date_str
+        # Long days start with one batch of rows; a refresh of the same
+        # day keeps every row that was already rendered
+        limit = list_view.RENDER_BATCH
+        if same_date:
+            limit = max(limit, len(old) if list_view.pending_keys else len(keys))
+        keys, list_view.pending_keys = keys[:limit], keys[limit:]
+        keep = 0
+        for widget, key in zip(old, keys):
+            if widget.row_key != key:
+                break
+            keep += 1
+        tail = 0
+        limit = min(len(old), len(keys)) - keep
+        while tail < limit and old[-1 - tail].row_key == keys[-1 - tail]:
+            tail += 1
+
+        stale = old[keep:len(old) - tail]
+        fresh = [make_detail_row(k) for k in keys[keep:len(keys) - tail]]
+        if not stale and not fresh:
+            return
+        index = list_view.index if same_date else 0
+        if same_date and index is not None and index >= len(old) - tail:
+            # The highlighted row is in the kept tail; follow it
+            index += len(keys) - len(old)
+        if fresh:
+            if tail:
+                list_view.mount(*fresh, before=old[len(old) - tail])
+            else:
+                list_view.extend(fresh)
+        if stale:
+            await list_view.remove_children(stale)
+        list_view.index = min(index or 0, len(keys) - 1) if keys else None
+        self.call_after_refresh(list_view.fill_viewport)
+
+    async def redraw(self, *, full_month: bool, old_date=None):
+        """Updates the calendar and the details panel for current_date_obj.
+
+        Without full_month only the selection moves from old_date; the grid
+        is refilled anyway if the date is not in the month rendered, e.g.
+        while a month change is still waiting for its refresh.
+        """
+        new_date = self.current_date_obj
+        if full_month or new_date not in self._day_widgets:
+            await self.refresh_calendar()
         else:
-            list_view = ActionListView(*widgets)
-            panel.mount(list_view)
+            self.move_selection(old_date, new_date)
+        self.show_details()
 
     async def change_selected_date(self, new_date: date):
+        # Held movement keys fire faster than a redraw; coalesce each burst
+        # into one redraw at the final date.
+        if self._redraw_timer is None:
+            self._pending_date = self.current_date_obj
+            self._redraw_timer = self.set_timer(0.016, self._flush_redraw)
         self.current_date_obj = new_date
-        if (new_date.year != self.display_year) or (new_date.month != self.display_month):
+
+    async def _flush_redraw(self):
+        old_date, self._pending_date = self._pending_date, None
+        self._redraw_timer = None
+        new_date = self.current_date_obj
+        full_month = (new_date.year, new_date.month) != (
+            self.display_year, self.display_month)
+        if full_month:
             self.display_year, self.display_month = new_date.year, new_date.month
-            await self.refresh_calendar()
-        else:
-            await self.refresh_calendar()
-        self.show_details()
+        await self.redraw(full_month=full_month, old_date=old_date)
 
     async def action_move_left(self): await self.change_selected_date(
-        self.current_date_obj - timedelta(days=1))
+        self.current_date_obj - ONE_DAY)
 
     async def action_move_right(self): await self.change_selected_date(
-        self.current_date_obj + timedelta(days=1))
+        self.current_date_obj + ONE_DAY)
 
     async def action_move_up(self): await self.change_selected_date(
-        self.current_date_obj - timedelta(weeks=1))
+        self.current_date_obj - ONE_WEEK)
 
     async def action_move_down(self): await self.change_selected_date(
-        self.current_date_obj + timedelta(weeks=1))
+        self.current_date_obj + ONE_WEEK)
 
     async def action_jump_today(
-        self): await self.change_selected_date(date.today())
+        self): await self.change_selected_date(self.today)
 
     async def action_jump_prev(self):
-        await self.change_selected_date(date.today() - timedelta(days=1))
+        await self.change_selected_date(self.today - ONE_DAY)
 
     async def action_jump_next(self):
-        await self.change_selected_date(date.today() + timedelta(days=1))
+        await self.change_selected_date(self.today + ONE_DAY)
 
-    async def action_prev_month(self):
-        if self.display_month == 1:
-            self.display_month = 12
-            self.display_year -= 1
-        else:
-            self.display_month -= 1
-        await self.refresh_calendar()
+    def shift_month(self, delta):
+        # Months are 1-based; shift on a 0-based index and carry the year
+        years, month = divmod(self.display_month - 1 + delta, 12)
+        self.display_year += years
+        self.display_month = month + 1
+        self.schedule_refresh()
 
-    async def action_next_month(self):
-        if self.display_month == 12:
-            self.display_month = 1
-            self.display_year += 1
-        else:
-            self.display_month += 1
-        await self.refresh_calendar()
+    async def action_prev_month(self): self.shift_month(-1)
+
+    async def action_next_month(self): self.shift_month(1)
 
     async def action_prev_year(self):
         self.display_year -= 1
-        await self.refresh_calendar()
+        self.schedule_refresh()
 
     async def action_next_year(self):
         self.display_year += 1
-        await self.refresh_calendar()
-
-    @on(Button.Pressed, "#btn-prev-month")
-    async def on_prev_month_click(self): await self.action_prev_month()
-    @on(Button.Pressed, "#btn-next-month")
-    async def on_next_month_click(self): await self.action_next_month()
-    @on(Button.Pressed, "#btn-prev-year")
-    async def on_prev_year_click(self): await self.action_prev_year()
-    @on(Button.Pressed, "#btn-next-year")
-    async def on_next_year_click(self): await self.action_next_year()
-
-    @on(Button.Pressed)
-    async def on_day_click(self, event: Button.Pressed):
-        if isinstance(event.button, CalendarDay) and event.button.full_date:
-            await self.change_selected_date(event.button.full_date)
+        self.schedule_refresh()
+
+    # Header button id -> action it triggers
+    NAV_ACTIONS = {
+        "btn-prev-month": "action_prev_month",
+        "btn-next-month": "action_next_month",
+        "btn-prev-year": "action_prev_year",
+        "btn-next-year": "action_next_year",
+    }
 
-    @on(ListView.Selected)
-    def on_item_click(self, event: ListView.Selected): pass
+    # Day cells are not Buttons; their clicks arrive via call_from_child()
+    @on(Button.Pressed, "#cal-header Button")
+    async def on_nav_click(self, event: Button.Pressed):
+        action = self.NAV_ACTIONS.get(event.button.id)
+        if action:
+            await getattr(self, action)()
 
 
 def run_tui():
     app = TimeMapApp()
     app.run()
-    app.run()
-    app.run()